@@ -0,0 +1,79 @@
+# cython: language_level=3
+"""AOT-compiled versions of the hot incentive helpers.
+
+Build in place with::
+
+    python setup.py build_ext --inplace
+
+incentive_app rebinds its helpers to these compiled versions when the
+extension is importable and falls back to its pure-Python definitions
+otherwise, so building this module is optional. The slab boundaries and
+rates here must stay in sync with the tables in incentive_app.py.
+"""
+
+cdef double[4] _V110 = [0.75, 0.90, 1.00, 1.20]
+cdef double[4] _V105 = [0.62, 0.70, 0.87, 1.00]
+cdef double[4] _V100 = [0.50, 0.60, 0.75, 0.80]
+cdef double[4] _V95 = [0.25, 0.30, 0.35, 0.40]
+
+
+cpdef long pcpm_group(long pcpm_x100):
+    """Return the MR group ordinal (0-3) for PCPM x100, or -1 when unset."""
+    if pcpm_x100 == 0:
+        return -1
+    if pcpm_x100 < 150:
+        return 0
+    if pcpm_x100 < 250:
+        return 1
+    if pcpm_x100 < 400:
+        return 2
+    return 3
+
+
+cpdef double volume_rate(double achievement, long gi):
+    """Return the volume incentive rate for an achievement % and group ordinal."""
+    if achievement >= 110:
+        return _V110[gi]
+    if achievement >= 105:
+        return _V105[gi]
+    if achievement >= 100:
+        return _V100[gi]
+    if achievement >= 95:
+        return _V95[gi]
+    return 0.0
+
+
+cpdef long hyterce_slab(double pcpm):
+    """Return the Hyterce slab index (0 = below Slab 1) for a PCPM value."""
+    if pcpm < 200:
+        return 0
+    if pcpm < 400:
+        return 1
+    if pcpm < 600:
+        return 2
+    return 3
+
+
+cpdef long resplash_slab(double units):
+    """Return the Resplash slab index (0 = below Aspire) for incremental units."""
+    if units < 1500:
+        return 0
+    if units < 3000:
+        return 1
+    if units < 4500:
+        return 2
+    if units < 6000:
+        return 3
+    return 4
+
+
+cpdef tuple manager_mult(long ach_x10, long threshold, double high_multiplier, long pct_mrs_x10):
+    """Return (eligible, multiplier) for a manager role, inputs scaled x10."""
+    cdef bint eligible = pct_mrs_x10 >= threshold * 10
+    cdef double multiplier = 0.0
+    if eligible:
+        if ach_x10 >= 1000:
+            multiplier = high_multiplier
+        elif ach_x10 >= 950:
+            multiplier = 1.0
+    return eligible, multiplier
@@ -22,9 +22,9 @@ and then execute:
 
     streamlit run incentive_app.py
 
-The app is designed for ease of use: each section appears in an expandable
-accordion. Enter the required values and the incentive will be calculated
-immediately. All calculations follow the slabs, multipliers and flat
+The app is designed for ease of use: pick a calculator in the sidebar and
+only that section is rendered. Enter the required values and the incentive
+will be calculated immediately. All calculations follow the slabs, multipliers and flat
 amounts specified in the official incentive circulars. Where special
 eligibility requirements exist (e.g. minimum percentage of team members
 earning incentives), the app highlights them.
@@ -32,8 +32,156 @@ earning incentives), the app highlights them.
 Author: OpenAI ChatGPT
 """
 
+from bisect import bisect_right
+from functools import lru_cache, partial
+
+import numpy as np
+import pandas as pd
 import streamlit as st
 
+try:
+    # numba is optional: when present the batch CSV path runs JIT-compiled
+    # and parallelised instead of interpreted.
+    from numba import njit, prange
+except ImportError:
+    njit = prange = None
+
+# PCPM (Lakhs) group classification shared by all MR calculators. The breaks
+# are the slab boundaries from the circulars; bisect_right picks the group in
+# one lookup instead of a chain of comparisons on every rerun.
+_GROUP_BREAKS = (1.5, 2.5, 4.0)
+_GROUP_BREAKS_X100 = (150, 250, 400)
+_GROUPS = ("Group A", "Group B", "Group C", "Group D")
+
+
+@lru_cache(maxsize=256)
+def _pcpm_group(pcpm_x100):
+    """Return the MR group ordinal (0-3) for a PCPM value, or -1 when unset.
+
+    Takes PCPM scaled to an integer (round(pcpm * 100)) so the lru_cache key
+    is hashable and float noise from the widgets collapses onto one entry.
+    The ordinal indexes the rate tuples directly; _GROUPS[gi] gives the
+    display name.
+    """
+    return bisect_right(_GROUP_BREAKS_X100, pcpm_x100) if pcpm_x100 else -1
+
+
+# Hyterce slab tables: bisect_right over the PCPM breaks indexes straight into
+# the (slab, per-unit rate) pairs for the selected product.
+_HY_BREAKS = (200, 400, 600)
+_HY_SYRUP = (("No Incentive", 0), ("Slab 1", 4), ("Slab 2", 6), ("Slab 3", 8))
+_HY_DROPS = (("No Incentive", 0), ("Slab 1", 3), ("Slab 2", 4), ("Slab 3", 5))
+
+# Resplash slab table keyed by incremental units, same bisect pattern.
+_RESPLASH_BREAKS = (1500, 3000, 4500, 6000)
+_RESPLASH_SLABS = (
+    ("No Incentive", 0),
+    ("Aspire", 0.75),
+    ("Eminence", 1.00),
+    ("Pinnacle", 1.25),
+    ("Summit", 1.50),
+)
+
+
+def _hyterce_slab(pcpm):
+    """Return the Hyterce slab index (0 = below Slab 1) for a PCPM value."""
+    return bisect_right(_HY_BREAKS, pcpm)
+
+
+def _resplash_slab(units):
+    """Return the Resplash slab index (0 = below Aspire) for incremental units."""
+    return bisect_right(_RESPLASH_BREAKS, units)
+
+# Flat brand incentive amounts, rows ordered Group A-D so the bisect group
+# index from _GROUP_BREAKS selects the row directly. Built once at import
+# instead of as dict literals inside the calculators.
+_BRAND11_AMOUNTS = (
+    (0, 1000, 2000, 3000, 4000, 5000, 6000, 7000, 8000, 9000, 10000, 11000),
+    (0, 1500, 3000, 4500, 6000, 7500, 9000, 10500, 12000, 13500, 15000, 16500),
+    (0, 2000, 4000, 6000, 8000, 10000, 12000, 14000, 16000, 18000, 20000, 22000),
+    (0, 2500, 5000, 7500, 10000, 12500, 15000, 17500, 20000, 22500, 25000, 27500),
+)
+_QBRAND_AMOUNTS = (
+    (0, 500, 1000, 1500, 2000),
+    (0, 750, 1500, 2250, 3000),
+    (0, 1000, 2000, 3000, 4000),
+    (0, 1500, 3000, 4500, 6000),
+)
+
+# Flattened views of the amount tables: one subscript on a contiguous tuple
+# (row index * row width + column) instead of two chained lookups.
+_BRAND11_FLAT = tuple(v for row in _BRAND11_AMOUNTS for v in row)
+_QBRAND_FLAT = tuple(v for row in _QBRAND_AMOUNTS for v in row)
+
+# Volume incentive rates (% of net primary sale) by achievement threshold,
+# each tier a tuple indexed by group ordinal. Built once at import so reruns
+# do not rebuild tables inside mr_volume_incentive.
+_VOLUME_RATES = (
+    (110, (0.75, 0.90, 1.00, 1.20)),
+    (105, (0.62, 0.70, 0.87, 1.00)),
+    (100, (0.50, 0.60, 0.75, 0.80)),
+    (95, (0.25, 0.30, 0.35, 0.40)),
+)
+
+
+def _volume_rate(achievement, gi):
+    """Return the volume incentive rate for an achievement % and group ordinal."""
+    for threshold, rates in _VOLUME_RATES:
+        if achievement >= threshold:
+            return rates[gi]
+    return 0
+
+
+# Annual incentive multipliers by group ordinal (A-D), shared by the
+# interactive and batch kernels. Numba lowers module-level tuples to
+# contiguous constants.
+_MULT_110 = (1.0, 1.1, 1.25, 1.5)
+_MULT_105 = (0.75, 0.8, 0.9, 1.0)
+
+# Manager achievement tiers, scaled x10 to match _manager_mult's integer
+# inputs: below 95 %, 95-99.99 %, and 100 % or more.
+_MGR_ACH_BREAKS = (950, 1000)
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _mr_annual_batch(pcpm, ach, salary, out):
+        """Fill out[i] with the annual incentive for each MR row."""
+        for i in prange(pcpm.size):
+            if pcpm[i] < 1.5:
+                g = 0
+            elif pcpm[i] < 2.5:
+                g = 1
+            elif pcpm[i] < 4.0:
+                g = 2
+            else:
+                g = 3
+            if ach[i] >= 110:
+                m = _MULT_110[g]
+            elif ach[i] >= 105:
+                m = _MULT_105[g]
+            else:
+                m = 0.0
+            out[i] = salary[i] * m
+else:
+    _mr_annual_batch = None
+
+# NumPy views of the batch constants for the no-numba fallback below.
+_GROUP_BREAKS_ARR = np.array(_GROUP_BREAKS)
+_MULT_110_ARR = np.array(_MULT_110)
+_MULT_105_ARR = np.array(_MULT_105)
+
+
+def _mr_annual_batch_numpy(pcpm, ach, salary):
+    """Vectorised fallback for _mr_annual_batch when numba is unavailable.
+
+    searchsorted classifies every row into its group in one C-level pass and
+    the multipliers are gathered with boolean masks, so no Python loop runs
+    over the rows.
+    """
+    g = np.searchsorted(_GROUP_BREAKS_ARR, pcpm, side="right")
+    m = np.where(ach >= 110, _MULT_110_ARR[g], np.where(ach >= 105, _MULT_105_ARR[g], 0.0))
+    return salary * m
+
 # Define concise terms & conditions for each incentive calculator. These
 # summaries mirror the key points from the official circulars and are
 # displayed at the bottom of each calculator.
@@ -86,56 +234,231 @@ TERMS = {
 }
 
 
-def hyterce_calculator():
-    st.header("Hyterce: Dual Opportunity Incentive")
-    product = st.selectbox(
-        "Select Product", ["", "Syrup", "Drops"], index=0, key="hyterce_product"
-    )
-    total_units = st.number_input(
-        "Total primary units (Jun–Aug 2025)",
-        min_value=0,
-        step=1,
-        value=0,
-        key="hyterce_total_units",
+# Terms prerendered to markdown bullet blocks at import, then aliased per
+# calculator so reruns neither probe TERMS nor rejoin the lines.
+_TERMS_MD = {key: "\n".join(f"- {line}" for line in lines) for key, lines in TERMS.items()}
+_HYTERCE_TERMS = _TERMS_MD["hyterce"]
+_MR_ANNUAL_TERMS = _TERMS_MD["mr_annual"]
+_MR_VOLUME_TERMS = _TERMS_MD["mr_volume"]
+_MR_BRAND_TERMS = _TERMS_MD["mr_brand"]
+_MR_QBRAND_TERMS = _TERMS_MD["mr_quarterly_brand"]
+_ASM_TERMS = _TERMS_MD["ASM"]
+_RSM_BM_TERMS = _TERMS_MD["RSM/BM"]
+_ZBM_TERMS = _TERMS_MD["ZBM"]
+_RESPLASH_TERMS = _TERMS_MD["resplash"]
+
+
+def _render_terms(terms_md):
+    """Emit a prerendered terms & conditions block as one markdown widget."""
+    st.markdown("**Terms & Conditions**\n\n" + terms_md)
+
+
+# Result block templates, parsed once at import. Calculators fill them with
+# str.format instead of rebuilding f-string literals on every rerun.
+_HY_TPL = (
+    "**PCPM:** {pcpm:.2f} units per month\n\n"
+    "**Slab:** {slab}\n\n"
+    "**Per unit incentive:** ₹{rate:.2f}\n\n"
+    "**Total incentive:** ₹{incentive:.2f}"
+)
+_ANNUAL_TPL = (
+    "**Group:** {group}\n\n"
+    "**Multiplier:** {multiplier:g}× monthly salary\n\n"
+    "**Incentive:** ₹{incentive:,.2f}"
+)
+_VOLUME_TPL = (
+    "**Group:** {group}\n\n"
+    "**Rate:** {rate}% of net primary sale\n\n"
+    "**Incentive:** ₹{incentive:,.2f}"
+)
+_FLAT_TPL = "**Group:** {group}\n\n**Flat incentive:** ₹{incentive:,}"
+_MANAGER_TPL = (
+    "**Eligible?** Yes (requires ≥{threshold}% MRs with incentives)\n\n"
+    "**Multiplier:** {multiplier:g}× average MR incentive\n\n"
+    "**Average MR incentive:** ₹{average:,.2f}\n\n"
+    "**{role_name} incentive:** ₹{incentive:,.2f}"
+)
+_RESPLASH_TPL = (
+    "**Incremental units:** {incremental_units}\n\n"
+    "**Slab:** {slab}\n\n"
+    "**Per‑unit rate:** ₹{rate:.2f}\n\n"
+    "**Precision incentive:** ₹{precision_incentive:,.2f}\n\n"
+    "**Eligible for excellence?** {excellence}"
+)
+_BATCH_TPL = "**Rows processed:** {rows}\n\n**Total projected incentive:** ₹{total:,.2f}"
+
+
+# Widget spec tables: (widget kind, label, kwargs, session key) per input.
+# _mk_inputs loops over a table once per rerun instead of each calculator
+# hand-coding its st.number_input/st.selectbox calls. PCPM and achievement
+# use sliders with coarse steps so the cache keys of the st.cache_data
+# kernels quantize onto a small set of values instead of churning on
+# arbitrary typed floats.
+_HY_SPECS = (
+    ("selectbox", "Select Product", {"options": ["", "Syrup", "Drops"], "index": 0}, "hyterce_product"),
+    ("number_input", "Total primary units (Jun–Aug 2025)", {"min_value": 0, "step": 1, "value": 0}, "hyterce_total_units"),
+    ("number_input", "Number of months (default 3)", {"min_value": 1, "max_value": 3, "value": 3}, "hyterce_months"),
+)
+_MR_ANNUAL_SPECS = (
+    ("slider", "PCPM (Lakhs)", {"min_value": 0.0, "max_value": 10.0, "value": 0.0, "step": 0.25}, "mr_annual_pcpm"),
+    ("slider", "Achievement %", {"min_value": 0.0, "max_value": 150.0, "value": 0.0, "step": 0.5}, "mr_annual_achievement"),
+    ("number_input", "Monthly gross salary (Rs)", {"min_value": 0.0, "step": 1000.0, "value": 0.0}, "mr_annual_salary"),
+)
+_MR_VOLUME_SPECS = (
+    ("selectbox", "Period", {"options": ["", "Quarter", "Annual"], "index": 0}, "mr_volume_period"),
+    ("slider", "PCPM (Lakhs)", {"min_value": 0.0, "max_value": 10.0, "value": 0.0, "step": 0.25}, "mr_volume_pcpm"),
+    ("slider", "Achievement %", {"min_value": 0.0, "max_value": 150.0, "value": 0.0, "step": 0.5}, "mr_volume_achievement"),
+    ("number_input", "Net primary sale (Rs)", {"min_value": 0.0, "step": 1000.0, "value": 0.0}, "mr_volume_sale"),
+)
+_MR_BRAND_SPECS = (
+    ("slider", "Annual PCPM (Lakhs)", {"min_value": 0.0, "max_value": 10.0, "value": 0.0, "step": 0.25}, "mr_brand_pcpm"),
+    ("number_input", "Number of brand groups achieving 100% target", {"min_value": 1, "max_value": 11, "step": 1, "value": 1}, "mr_brand_groups"),
+)
+_MR_QBRAND_SPECS = (
+    ("slider", "PCPM for the quarter (Lakhs)", {"min_value": 0.0, "max_value": 10.0, "value": 0.0, "step": 0.25}, "mr_qb_pcpm"),
+    ("number_input", "Number of brands achieving 100% target", {"min_value": 1, "max_value": 4, "step": 1, "value": 1}, "mr_qb_brands"),
+)
+_RESPLASH_SPECS = (
+    ("number_input", "Base sale units (Mar–Jun 2024)", {"min_value": 0, "step": 1, "value": 0}, "resplash_base_units"),
+    ("number_input", "Sale units (Mar–Jun 2025)", {"min_value": 0, "step": 1, "value": 0}, "resplash_current_units"),
+)
+
+# Manager widget specs share one template; per-role tables with unique keys
+# are stamped out once at import by _manager_specs.
+_MANAGER_SPEC_TEMPLATE = (
+    ("slider", "Achievement %", {"min_value": 0.0, "max_value": 150.0, "value": 0.0, "step": 0.5}, "achievement"),
+    ("number_input", "Total MR incentive amount (Rs)", {"min_value": 0.0, "step": 1000.0, "value": 0.0}, "total"),
+    ("number_input", "Number of MRs in team", {"min_value": 1, "step": 1, "value": 1}, "count"),
+    ("number_input", "Percentage of MRs earning incentives (%)", {"min_value": 0.0, "max_value": 100.0, "step": 1.0, "value": 0.0}, "pct"),
+)
+
+
+def _manager_specs(key_base):
+    """Return the manager widget specs with keys made unique per role."""
+    return tuple(
+        (kind, label, kwargs, f"{key_base}_{suffix}")
+        for kind, label, kwargs, suffix in _MANAGER_SPEC_TEMPLATE
     )
-    months = st.number_input(
-        "Number of months (default 3)",
-        min_value=1,
-        max_value=3,
-        value=3,
-        key="hyterce_months",
+
+
+def _mk_inputs(specs):
+    """Build the widgets described by a spec table; return values keyed by widget key."""
+    return {
+        key: getattr(st, kind)(label, key=key, **kwargs)
+        for kind, label, kwargs, key in specs
+    }
+
+
+# Pure calculation kernels. Streamlit reruns the whole script on every widget
+# interaction, so the arithmetic lives behind st.cache_data: unchanged inputs
+# hit the cache instead of recomputing.
+@st.cache_data(show_spinner=False)
+def _hyterce_result(product, total_units, months):
+    """Return (pcpm, slab, rate, incentive) for the Hyterce calculator."""
+    # months widget enforces min_value=1, so no zero guard is needed
+    pcpm = total_units / months
+    table = _HY_SYRUP if product == "Syrup" else _HY_DROPS
+    slab, rate = table[_hyterce_slab(pcpm)]
+    return pcpm, slab, rate, pcpm * rate
+
+
+@st.cache_data(show_spinner=False)
+def _mr_annual_result(pcpm, achievement, salary):
+    """Return (group, multiplier, incentive) for the MR annual incentive."""
+    gi = _pcpm_group(round(pcpm * 100))
+    if gi < 0:
+        return "", 0, 0
+    if achievement >= 110:
+        multiplier = _MULT_110[gi]
+    elif achievement >= 105:
+        multiplier = _MULT_105[gi]
+    else:
+        multiplier = 0
+    return _GROUPS[gi], multiplier, salary * multiplier
+
+
+@st.cache_data(show_spinner=False)
+def _mr_volume_result(pcpm, achievement, sale):
+    """Return (group, rate, incentive) for the MR volume incentive."""
+    gi = _pcpm_group(round(pcpm * 100))
+    if gi < 0:
+        return "", 0, 0
+    rate = _volume_rate(achievement, gi)
+    return _GROUPS[gi], rate, sale * rate / 100
+
+
+@st.cache_data(show_spinner=False)
+def _mr_brand_result(pcpm, num_groups):
+    """Return (group, flat incentive) for the Eminent 11 brand incentive."""
+    gi = _pcpm_group(round(pcpm * 100))
+    if gi < 0:
+        return "", 0
+    return _GROUPS[gi], _BRAND11_FLAT[gi * 12 + int(num_groups)]
+
+
+@st.cache_data(show_spinner=False)
+def _mr_qbrand_result(pcpm, num_brands):
+    """Return (group, flat incentive) for the quarterly brand incentive."""
+    gi = _pcpm_group(round(pcpm * 100))
+    if gi < 0:
+        return "", 0
+    return _GROUPS[gi], _QBRAND_FLAT[gi * 5 + int(num_brands)]
+
+
+@lru_cache(maxsize=256)
+def _manager_mult(ach_x10, threshold, high_multiplier, pct_mrs_x10):
+    """Return (eligible, multiplier) for a manager role.
+
+    Achievement and MR percentage arrive scaled to integers (round(x * 10))
+    so cache keys are exact and survive float noise across reruns.
+    """
+    eligible = pct_mrs_x10 >= threshold * 10
+    tier = bisect_right(_MGR_ACH_BREAKS, ach_x10) if eligible else 0
+    return eligible, (0.0, 1.0, high_multiplier)[tier]
+
+
+@st.cache_data(show_spinner=False)
+def _manager_result(achievement, total_mr_incentive, num_mrs, pct_mrs, threshold, high_multiplier):
+    """Return (eligible, multiplier, average MR incentive, incentive)."""
+    eligible, multiplier = _manager_mult(
+        round(achievement * 10), threshold, high_multiplier, round(pct_mrs * 10)
     )
+    # num_mrs widget enforces min_value=1, so no zero guard is needed
+    average_mr_incentive = total_mr_incentive / num_mrs
+    incentive = average_mr_incentive * multiplier if multiplier > 0 else 0
+    return eligible, multiplier, average_mr_incentive, incentive
+
+
+@st.cache_data(show_spinner=False)
+def _resplash_result(base_units, current_units):
+    """Return (incremental units, slab, rate, precision incentive, excellence)."""
+    incremental_units = current_units - base_units if current_units > base_units else 0
+    slab, rate = _RESPLASH_SLABS[_resplash_slab(incremental_units)]
+    return incremental_units, slab, rate, incremental_units * rate, incremental_units >= 7500
+
+
+# Optional AOT-compiled helpers (see setup.py and _incentive_kernels.pyx).
+# When the Cython extension has been built, rebind the hot helpers to their
+# native versions; the pure-Python definitions above stay as the fallback.
+try:
+    import _incentive_kernels as _kernels
+except ImportError:
+    _kernels = None
+
+if _kernels is not None:
+    _pcpm_group = lru_cache(maxsize=256)(_kernels.pcpm_group)
+    _volume_rate = _kernels.volume_rate
+    _hyterce_slab = _kernels.hyterce_slab
+    _resplash_slab = _kernels.resplash_slab
+    _manager_mult = lru_cache(maxsize=256)(_kernels.manager_mult)
+
+
+def hyterce_calculator():
+    st.header("Hyterce: Dual Opportunity Incentive")
+    product, total_units, months = _mk_inputs(_HY_SPECS).values()
     if product:
-        pcpm = total_units / months if months else 0
-        # Determine slab and per‑unit incentive
-        slab = "No Incentive"
-        rate = 0
-        if pcpm >= 200:
-            if pcpm < 400:
-                slab = "Slab 1"
-            elif pcpm < 600:
-                slab = "Slab 2"
-            else:
-                slab = "Slab 3"
-            if product == "Syrup":
-                if slab == "Slab 1":
-                    rate = 4
-                elif slab == "Slab 2":
-                    rate = 6
-                else:
-                    rate = 8
-            else:  # Drops
-                if slab == "Slab 1":
-                    rate = 3
-                elif slab == "Slab 2":
-                    rate = 4
-                else:
-                    rate = 5
-        incentive = pcpm * rate
-        st.write(f"**PCPM:** {pcpm:.2f} units per month")
-        st.write(f"**Slab:** {slab}")
-        st.write(f"**Per unit incentive:** ₹{rate:.2f}")
-        st.write(f"**Total incentive:** ₹{incentive:.2f}")
+        pcpm, slab, rate, incentive = _hyterce_result(product, total_units, months)
+        st.markdown(_HY_TPL.format(pcpm=pcpm, slab=slab, rate=rate, incentive=incentive))
         st.info(
             "Example: 2100 units of Syrup across three months results in a PCPM of 700. "
             "This falls into Slab 3 with an 8 Rs rate, yielding 700 × 8 = ₹5600."
@@ -143,355 +466,144 @@ def hyterce_calculator():
     else:
         st.write("Please select a product and enter units to calculate the incentive.")
     # Display terms
-    if TERMS.get("hyterce"):
-        st.markdown("\n**Terms & Conditions**")
-        for line in TERMS["hyterce"]:
-            st.markdown(f"- {line}")
+    _render_terms(_HYTERCE_TERMS)
 
 
 def mr_annual_incentive():
     st.header("MR Annual Incentive")
-    pcpm = st.number_input(
-        "PCPM (Lakhs)", min_value=0.0, step=0.01, value=0.0, key="mr_annual_pcpm"
-    )
-    achievement = st.number_input(
-        "Achievement %", min_value=0.0, step=0.1, value=0.0, key="mr_annual_achievement"
-    )
-    salary = st.number_input(
-        "Monthly gross salary (Rs)",
-        min_value=0.0,
-        step=1000.0,
-        value=0.0,
-        key="mr_annual_salary",
-    )
-    group = ""
-    if pcpm:
-        if pcpm < 1.5:
-            group = "Group A"
-        elif pcpm < 2.5:
-            group = "Group B"
-        elif pcpm < 4.0:
-            group = "Group C"
-        else:
-            group = "Group D"
-    multiplier = 0
-    if achievement >= 110:
-        if group == "Group A":
-            multiplier = 1
-        elif group == "Group B":
-            multiplier = 1.1
-        elif group == "Group C":
-            multiplier = 1.25
-        elif group == "Group D":
-            multiplier = 1.5
-    elif achievement >= 105:
-        if group == "Group A":
-            multiplier = 0.75
-        elif group == "Group B":
-            multiplier = 0.8
-        elif group == "Group C":
-            multiplier = 0.9
-        elif group == "Group D":
-            multiplier = 1
-    incentive = salary * multiplier
+    pcpm, achievement, salary = _mk_inputs(_MR_ANNUAL_SPECS).values()
+    group, multiplier, incentive = _mr_annual_result(pcpm, achievement, salary)
     if group:
-        st.write(f"**Group:** {group}")
         if multiplier > 0:
-            st.write(f"**Multiplier:** {multiplier}× monthly salary")
-            st.write(f"**Incentive:** ₹{incentive:,.2f}")
+            st.markdown(_ANNUAL_TPL.format(group=group, multiplier=multiplier, incentive=incentive))
         else:
+            st.markdown(f"**Group:** {group}")
             st.warning("Achievement below 105% does not qualify for annual incentive.")
     else:
         st.write("Enter PCPM to determine group and incentive.")
     # Display terms
-    if TERMS.get("mr_annual"):
-        st.markdown("\n**Terms & Conditions**")
-        for line in TERMS["mr_annual"]:
-            st.markdown(f"- {line}")
+    _render_terms(_MR_ANNUAL_TERMS)
+
+
+def mr_annual_batch_calculator():
+    st.header("MR Annual Incentive (Batch CSV)")
+    st.write(
+        "Upload a CSV with pcpm, achievement and salary columns to project "
+        "annual incentives for an entire field force in one pass."
+    )
+    uploaded = st.file_uploader("CSV file", type="csv", key="mr_annual_batch_csv")
+    if uploaded is None:
+        return
+    df = pd.read_csv(uploaded)
+    missing = [c for c in ("pcpm", "achievement", "salary") if c not in df.columns]
+    if missing:
+        st.error(f"CSV is missing required columns: {', '.join(missing)}")
+        return
+    pcpm = df["pcpm"].to_numpy(np.float64)
+    ach = df["achievement"].to_numpy(np.float64)
+    salary = df["salary"].to_numpy(np.float64)
+    if _mr_annual_batch is not None:
+        out = np.empty(pcpm.size, np.float64)
+        _mr_annual_batch(pcpm, ach, salary, out)
+    else:
+        out = _mr_annual_batch_numpy(pcpm, ach, salary)
+    df["incentive"] = out
+    st.markdown(_BATCH_TPL.format(rows=len(df), total=out.sum()))
+    st.dataframe(df)
 
 
 def mr_volume_incentive():
     st.header("MR Volume Incentive (Quarterly/Annual)")
-    period = st.selectbox(
-        "Period",
-        ["", "Quarter", "Annual"],
-        index=0,
-        key="mr_volume_period",
-    )
-    pcpm = st.number_input(
-        "PCPM (Lakhs)", min_value=0.0, step=0.01, value=0.0, key="mr_volume_pcpm"
-    )
-    achievement = st.number_input(
-        "Achievement %", min_value=0.0, step=0.1, value=0.0, key="mr_volume_achievement"
-    )
-    sale = st.number_input(
-        "Net primary sale (Rs)",
-        min_value=0.0,
-        step=1000.0,
-        value=0.0,
-        key="mr_volume_sale",
-    )
-    group = ""
-    if pcpm:
-        if pcpm < 1.5:
-            group = "Group A"
-        elif pcpm < 2.5:
-            group = "Group B"
-        elif pcpm < 4.0:
-            group = "Group C"
-        else:
-            group = "Group D"
-    rate = 0
+    period, pcpm, achievement, sale = _mk_inputs(_MR_VOLUME_SPECS).values()
+    group, rate, incentive = _mr_volume_result(pcpm, achievement, sale)
     if period and group:
-        def lookup_rate(ach, grp):
-            # helper function to return rate for quarter/annual
-            if ach >= 110:
-                return {
-                    "Group A": 0.75,
-                    "Group B": 0.90,
-                    "Group C": 1.00,
-                    "Group D": 1.20,
-                }[grp]
-            elif ach >= 105:
-                return {
-                    "Group A": 0.62,
-                    "Group B": 0.70,
-                    "Group C": 0.87,
-                    "Group D": 1.00,
-                }[grp]
-            elif ach >= 100:
-                return {
-                    "Group A": 0.50,
-                    "Group B": 0.60,
-                    "Group C": 0.75,
-                    "Group D": 0.80,
-                }[grp]
-            elif ach >= 95:
-                return {
-                    "Group A": 0.25,
-                    "Group B": 0.30,
-                    "Group C": 0.35,
-                    "Group D": 0.40,
-                }[grp]
-            else:
-                return 0
-        rate = lookup_rate(achievement, group)
-        incentive = sale * rate / 100
-        st.write(f"**Group:** {group}")
         if rate > 0:
-            st.write(f"**Rate:** {rate}% of net primary sale")
-            st.write(f"**Incentive:** ₹{incentive:,.2f}")
+            st.markdown(_VOLUME_TPL.format(group=group, rate=rate, incentive=incentive))
         else:
+            st.markdown(f"**Group:** {group}")
             st.warning("Achievement below 95% does not qualify for volume incentive.")
     else:
         st.write("Select period and enter PCPM to determine incentive.")
     # Display terms
-    if TERMS.get("mr_volume"):
-        st.markdown("\n**Terms & Conditions**")
-        for line in TERMS["mr_volume"]:
-            st.markdown(f"- {line}")
+    _render_terms(_MR_VOLUME_TERMS)
 
 
 def mr_brand_incentive():
     st.header("MR Eminent 11 Brand Incentive")
-    pcpm = st.number_input(
-        "Annual PCPM (Lakhs)", min_value=0.0, step=0.01, value=0.0, key="mr_brand_pcpm"
-    )
-    num_groups = st.number_input(
-        "Number of brand groups achieving 100% target",
-        min_value=1,
-        max_value=11,
-        step=1,
-        value=1,
-        key="mr_brand_groups",
-    )
-    group = ""
-    if pcpm:
-        if pcpm < 1.5:
-            group = "Group A"
-        elif pcpm < 2.5:
-            group = "Group B"
-        elif pcpm < 4.0:
-            group = "Group C"
-        else:
-            group = "Group D"
-    # Flat amounts table
-    amounts = {
-        "Group A": [0, 1000, 2000, 3000, 4000, 5000, 6000, 7000, 8000, 9000, 10000, 11000],
-        "Group B": [0, 1500, 3000, 4500, 6000, 7500, 9000, 10500, 12000, 13500, 15000, 16500],
-        "Group C": [0, 2000, 4000, 6000, 8000, 10000, 12000, 14000, 16000, 18000, 20000, 22000],
-        "Group D": [0, 2500, 5000, 7500, 10000, 12500, 15000, 17500, 20000, 22500, 25000, 27500],
-    }
-    incentive = 0
+    pcpm, num_groups = _mk_inputs(_MR_BRAND_SPECS).values()
+    group, incentive = _mr_brand_result(pcpm, num_groups)
     if group:
-        index = int(num_groups)
-        incentive = amounts[group][index]
-        st.write(f"**Group:** {group}")
-        st.write(f"**Flat incentive:** ₹{incentive:,}")
+        st.markdown(_FLAT_TPL.format(group=group, incentive=incentive))
         st.info(
             "Brand groups are counted based on product families where 100% of target is achieved."
         )
     else:
         st.write("Enter PCPM to determine group and incentive.")
     # Display terms
-    if TERMS.get("mr_brand"):
-        st.markdown("\n**Terms & Conditions**")
-        for line in TERMS["mr_brand"]:
-            st.markdown(f"- {line}")
+    _render_terms(_MR_BRAND_TERMS)
 
 
 def mr_quarterly_brand_incentive():
     st.header("MR Quarterly Brand‑Specific Incentive")
-    pcpm = st.number_input(
-        "PCPM for the quarter (Lakhs)",
-        min_value=0.0,
-        step=0.01,
-        value=0.0,
-        key="mr_qb_pcpm",
-    )
-    num_brands = st.number_input(
-        "Number of brands achieving 100% target",
-        min_value=1,
-        max_value=4,
-        step=1,
-        value=1,
-        key="mr_qb_brands",
-    )
-    group = ""
-    if pcpm:
-        if pcpm < 1.5:
-            group = "Group A"
-        elif pcpm < 2.5:
-            group = "Group B"
-        elif pcpm < 4.0:
-            group = "Group C"
-        else:
-            group = "Group D"
-    amounts = {
-        "Group A": [0, 500, 1000, 1500, 2000],
-        "Group B": [0, 750, 1500, 2250, 3000],
-        "Group C": [0, 1000, 2000, 3000, 4000],
-        "Group D": [0, 1500, 3000, 4500, 6000],
-    }
+    pcpm, num_brands = _mk_inputs(_MR_QBRAND_SPECS).values()
+    group, incentive = _mr_qbrand_result(pcpm, num_brands)
     if group:
-        incentive = amounts[group][int(num_brands)]
-        st.write(f"**Group:** {group}")
-        st.write(f"**Flat incentive:** ₹{incentive:,}")
+        st.markdown(_FLAT_TPL.format(group=group, incentive=incentive))
         st.info(
             "Only the brands Acolate, Tynol, Vitfol and DFS are considered for the quarterly brand‑specific incentive."
         )
     else:
         st.write("Enter PCPM to determine group and incentive.")
     # Display terms
-    if TERMS.get("mr_quarterly_brand"):
-        st.markdown("\n**Terms & Conditions**")
-        for line in TERMS["mr_quarterly_brand"]:
-            st.markdown(f"- {line}")
+    _render_terms(_MR_QBRAND_TERMS)
+
 
+def manager_incentive(role_name, threshold, high_multiplier, terms, specs):
+    """Generic calculator for ASM, RSM/BM and ZBM roles.
 
-def manager_incentive(role_name, threshold, high_multiplier):
-    """Generic calculator for ASM, RSM/BM and ZBM roles."""
+    terms and specs are prebuilt per role in _MANAGERS: specs carries the
+    widget definitions with role-unique keys and terms the role's
+    prerendered terms markdown, so nothing is derived here on each rerun.
+    """
     st.header(f"{role_name} Incentive")
-    # Generate unique keys based on role name to avoid duplicate element IDs
-    key_base = role_name.replace("/", "_").replace(" ", "_")
-    achievement = st.number_input(
-        "Achievement %",
-        min_value=0.0,
-        step=0.1,
-        value=0.0,
-        key=f"{key_base}_achievement",
+    achievement, total_mr_incentive, num_mrs, pct_mrs = _mk_inputs(specs).values()
+    eligible, multiplier, average_mr_incentive, incentive = _manager_result(
+        achievement, total_mr_incentive, num_mrs, pct_mrs, threshold, high_multiplier
     )
-    total_mr_incentive = st.number_input(
-        "Total MR incentive amount (Rs)",
-        min_value=0.0,
-        step=1000.0,
-        value=0.0,
-        key=f"{key_base}_total",
-    )
-    num_mrs = st.number_input(
-        "Number of MRs in team",
-        min_value=1,
-        step=1,
-        value=1,
-        key=f"{key_base}_count",
-    )
-    pct_mrs = st.number_input(
-        "Percentage of MRs earning incentives (%)",
-        min_value=0.0,
-        max_value=100.0,
-        step=1.0,
-        value=0.0,
-        key=f"{key_base}_pct",
-    )
-    eligible = pct_mrs >= threshold
-    multiplier = 0
-    if eligible:
-        if achievement >= 100:
-            multiplier = high_multiplier
-        elif achievement >= 95:
-            multiplier = 1
-    incentive = 0
-    if multiplier > 0:
-        average_mr_incentive = total_mr_incentive / num_mrs if num_mrs else 0
-        incentive = average_mr_incentive * multiplier
-    st.write(f"**Eligible?** {'Yes' if eligible else 'No'} (requires ≥{threshold}% MRs with incentives)")
     if eligible:
-        st.write(f"**Multiplier:** {multiplier}× average MR incentive")
-        st.write(f"**Average MR incentive:** ₹{(total_mr_incentive/num_mrs):,.2f}")
-        st.write(f"**{role_name} incentive:** ₹{incentive:,.2f}")
+        st.markdown(
+            _MANAGER_TPL.format(
+                threshold=threshold,
+                multiplier=multiplier,
+                average=average_mr_incentive,
+                role_name=role_name,
+                incentive=incentive,
+            )
+        )
     else:
+        st.markdown(f"**Eligible?** No (requires ≥{threshold}% MRs with incentives)")
         st.warning(
             f"Eligibility not met: at least {threshold}% of team MRs must earn incentives."
         )
     # Terms for manager roles
-    role_key = role_name
-    if TERMS.get(role_key):
-        st.markdown("\n**Terms & Conditions**")
-        for line in TERMS[role_key]:
-            st.markdown(f"- {line}")
+    _render_terms(terms)
 
 
 def resplash_incentive():
     st.header("Resplash Super 30 Incentive")
-    base_units = st.number_input(
-        "Base sale units (Mar–Jun 2024)",
-        min_value=0,
-        step=1,
-        value=0,
-        key="resplash_base_units",
-    )
-    current_units = st.number_input(
-        "Sale units (Mar–Jun 2025)",
-        min_value=0,
-        step=1,
-        value=0,
-        key="resplash_current_units",
+    base_units, current_units = _mk_inputs(_RESPLASH_SPECS).values()
+    incremental_units, slab, rate, precision_incentive, excellence_eligible = (
+        _resplash_result(base_units, current_units)
     )
-    incremental_units = current_units - base_units if current_units > base_units else 0
     if incremental_units > 0:
-        if incremental_units < 1500:
-            slab = "No Incentive"
-            rate = 0
-        elif incremental_units < 3000:
-            slab = "Aspire"
-            rate = 0.75
-        elif incremental_units < 4500:
-            slab = "Eminence"
-            rate = 1.00
-        elif incremental_units < 6000:
-            slab = "Pinnacle"
-            rate = 1.25
-        else:
-            slab = "Summit"
-            rate = 1.50
-        precision_incentive = incremental_units * rate
-        excellence_eligible = incremental_units >= 7500
-        st.write(f"**Incremental units:** {incremental_units}")
-        st.write(f"**Slab:** {slab}")
-        st.write(f"**Per‑unit rate:** ₹{rate:.2f}")
-        st.write(f"**Precision incentive:** ₹{precision_incentive:,.2f}")
-        st.write(
-            f"**Eligible for excellence?** {'Yes' if excellence_eligible else 'No'}"
+        st.markdown(
+            _RESPLASH_TPL.format(
+                incremental_units=incremental_units,
+                slab=slab,
+                rate=rate,
+                precision_incentive=precision_incentive,
+                excellence="Yes" if excellence_eligible else "No",
+            )
         )
         if excellence_eligible:
             st.success(
@@ -507,37 +619,45 @@ def resplash_incentive():
             "Incremental units must exceed zero. Enter your base and current units to calculate."
         )
     # Display terms
-    if TERMS.get("resplash"):
-        st.markdown("\n**Terms & Conditions**")
-        for line in TERMS["resplash"]:
-            st.markdown(f"- {line}")
+    _render_terms(_RESPLASH_TERMS)
+
+
+# Manager roles: (role name, eligibility threshold %, high achievement
+# multiplier, terms list, widget specs), prebuilt once at import.
+_MANAGERS = (
+    ("ASM", 60, 1.5, _ASM_TERMS, _manager_specs("ASM")),
+    ("RSM/BM", 50, 1.3, _RSM_BM_TERMS, _manager_specs("RSM_BM")),
+    ("ZBM", 40, 1.2, _ZBM_TERMS, _manager_specs("ZBM")),
+)
+
+# Calculator dispatch table for the sidebar. Only the selected entry runs on
+# a rerun, so the other eight calculators skip their widget registrations and
+# math entirely.
+_CALCULATORS = (
+    ("Hyterce Dual Opportunity Incentive", hyterce_calculator),
+    ("MR Annual Incentive", mr_annual_incentive),
+    ("MR Annual Incentive (Batch CSV)", mr_annual_batch_calculator),
+    ("MR Volume Incentive (Qtr/Annual)", mr_volume_incentive),
+    ("MR Eminent 11 Brand Incentive", mr_brand_incentive),
+    ("MR Quarterly Brand‑Specific Incentive", mr_quarterly_brand_incentive),
+    *(
+        (f"{role} Incentive", partial(manager_incentive, role, threshold, multiplier, terms, specs))
+        for role, threshold, multiplier, terms, specs in _MANAGERS
+    ),
+    ("Resplash Super 30 Incentive", resplash_incentive),
+)
+_CALC_LABELS = tuple(label for label, _ in _CALCULATORS)
+_CALC_FUNCS = dict(_CALCULATORS)
 
 
 def main():
     st.title("Gujarat Terce Incentive Calculators (FY 2025–26)")
     st.write(
-        "Use the sections below to compute different types of incentives. The app "
-        "closely follows the official circulars."
+        "Pick a calculator in the sidebar to compute different types of "
+        "incentives. The app closely follows the official circulars."
     )
-    # Expandable sections for each calculator
-    with st.expander("Hyterce Dual Opportunity Incentive"):
-        hyterce_calculator()
-    with st.expander("MR Annual Incentive"):
-        mr_annual_incentive()
-    with st.expander("MR Volume Incentive (Qtr/Annual)"):
-        mr_volume_incentive()
-    with st.expander("MR Eminent 11 Brand Incentive"):
-        mr_brand_incentive()
-    with st.expander("MR Quarterly Brand‑Specific Incentive"):
-        mr_quarterly_brand_incentive()
-    with st.expander("ASM Incentive"):
-        manager_incentive("ASM", threshold=60, high_multiplier=1.5)
-    with st.expander("RSM/BM Incentive"):
-        manager_incentive("RSM/BM", threshold=50, high_multiplier=1.3)
-    with st.expander("ZBM Incentive"):
-        manager_incentive("ZBM", threshold=40, high_multiplier=1.2)
-    with st.expander("Resplash Super 30 Incentive"):
-        resplash_incentive()
+    choice = st.sidebar.radio("Calculator", _CALC_LABELS, key="open_section")
+    _CALC_FUNCS[choice]()
 
 
 if __name__ == "__main__":
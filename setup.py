@@ -0,0 +1,16 @@
+"""Build script for the optional AOT-compiled incentive kernels.
+
+Run ``python setup.py build_ext --inplace`` with Cython installed to produce
+the _incentive_kernels extension next to incentive_app.py. The app works
+without it; when present, the hot helpers run as native code instead of
+bytecode.
+"""
+
+from setuptools import setup
+
+from Cython.Build import cythonize
+
+setup(
+    name="incentive-kernels",
+    ext_modules=cythonize("_incentive_kernels.pyx"),
+)